@@ -506,6 +506,13 @@ class PyPlasmaFractalApp:
         """
         Save the fractal params and release resources.
         """
+        if self.recorder.is_recording:
+            logging.info('Stopping active video recording')
+            try:
+                self.recorder.stop_recording()
+            except Exception as e:
+                logging.error(f"The recording could not be finished: {e}")
+
         self.save_config()
 
         logging.info('Saving window configuration')
@@ -1,4 +1,5 @@
 import colorsys
+import functools
 import math
 from typing import Tuple
 
@@ -33,6 +34,16 @@ def modify_rgba_color_hsv(color_rgba: Tuple[float, float, float, float],
     return (r, g, b, a)
 
 
+@functools.lru_cache(maxsize=16)
+def modify_rgba_color_hsv_cached(color_rgba: Tuple[float, float, float, float], 
+                                 hue_shift: float, saturation_factor: float, value_factor: float) -> Tuple[float, float, float, float]:
+    """
+    Cached variant of modify_rgba_color_hsv() for colors that are modified on every frame, like style colors.
+    The color must be hashable, e.g. a tuple. See modify_rgba_color_hsv() for a description of the arguments.
+    """
+    return modify_rgba_color_hsv(color_rgba, hue_shift, saturation_factor, value_factor)
+
+
 def sigmoid_contrast(x: float, contrast_steepness: float, contrast_midpoint: float) -> float:
     """
     Apply sigmoid-based contrast to values between 0 and 1.
@@ -31,6 +31,7 @@ class JsonFileStorage(Storage[Dict[str, Any]]):
         """
         self.directory = Path(directory)
         self.list_extension = list_extension
+        self._list_cache: Optional[Tuple[int, List[str]]] = None  # (directory mtime, filenames)
         try:
             self.directory.mkdir(parents=True, exist_ok=True)
         except Exception as e:
@@ -77,6 +78,7 @@ class JsonFileStorage(Storage[Dict[str, Any]]):
         # Add the .json extension to the filename, if missing
         filename = self._ensure_extension(filename)        
         path = self.directory / filename
+        self._list_cache = None
         try:
             with path.open('w') as file:
                 json.dump(data, file, indent=4, cls=EnumJSONEncoder)
@@ -97,6 +99,7 @@ class JsonFileStorage(Storage[Dict[str, Any]]):
         """
         filename = self._ensure_extension(filename)
         path = self.directory / filename
+        self._list_cache = None
         try:
             path.unlink()
         except FileNotFoundError as e:
@@ -108,6 +111,9 @@ class JsonFileStorage(Storage[Dict[str, Any]]):
     def list(self) -> List[str]:
         """
         List all JSON files in the storage directory.
+        
+        The listing is cached and only refreshed when the modification time of the directory changes,
+        when a file is saved or deleted through this storage, or when invalidate_cache() is called.
 
         Returns:
             List[str]: A list of filenames of all JSON files.
@@ -116,12 +122,27 @@ class JsonFileStorage(Storage[Dict[str, Any]]):
             StorageItemListingError: If the files in the directory cannot be listed.
         """
         try:
-            return [file.name if self.list_extension else file.stem for file in self.directory.glob('*.json')]
+            mtime = self.directory.stat().st_mtime_ns
+            if self._list_cache is None or self._list_cache[0] != mtime:
+                files = [file.name if self.list_extension else file.stem for file in self.directory.glob('*.json')]
+                self._list_cache = (mtime, files)
+
+            return list(self._list_cache[1])
 
         except Exception as e:
             raise StorageItemListingError(str(self.directory), "Could not list files from directory") from e
 
 
+    def invalidate_cache(self) -> None:
+        """
+        Discard the cached file listing, so the next call to list() scans the directory again.
+        
+        This is needed to pick up external changes on file systems with coarse directory modification times,
+        where such changes may not be detected by comparing the modification time.
+        """
+        self._list_cache = None
+
+
     def exists(self, filename: str) -> bool:
         """
         Check if a JSON file exists in the storage directory.
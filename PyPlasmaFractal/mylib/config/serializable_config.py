@@ -53,13 +53,24 @@ class SerializableConfig:
             handle_type_mismatch=handle_type_mismatch_gracefully
         )
         
+        self._apply_merged_dict(merged)
+
+    def _apply_merged_dict(self, merged: dict) -> None:
+        """
+        Set the attributes of this instance from the result of a deep merge.
+        Nested SerializableConfig objects are updated in place. As the deep merge already covers their values,
+        they are not merged a second time.
+
+        Args:
+            merged (dict): Dictionary produced by merging a source into the result of to_dict().
+        """
         for key, value in merged.items():
             if key.startswith('_'):
                 continue
                 
             current_value = getattr(self, key, None)
             if isinstance(current_value, SerializableConfig) and isinstance(value, dict):
-                # If we have a nested config object, merge into it instead of replacing it
-                current_value.merge_dict(value)
+                # If we have a nested config object, update it instead of replacing it
+                current_value._apply_merged_dict(value)
             else:
                 setattr(self, key, value)
@@ -55,3 +55,17 @@ class StorageSourceManager:
             items.extend(self.Item(name=name, storage=storage) for name in storage.list())
         
         return items
+
+
+    def invalidate_cache(self, storages: Optional[List[Storage]] = None) -> None:
+        """
+        Discards cached data of the specified storage instances, so the next listing reads them again.
+
+        Args:
+            storages (Optional[List[Storage]]): The list of storage instances to invalidate. 
+                If None, invalidates all storages.
+        """
+        storages = storages or [self.app_storage, self.user_storage]
+
+        for storage in storages:
+            storage.invalidate_cache()
@@ -95,6 +95,13 @@ class Storage(ABC, Generic[DataType]):
         """
         pass
     
+    def invalidate_cache(self) -> None:
+        """
+        Discard any cached data, so the next operation reads the underlying storage again.
+        Does nothing by default, storages that cache data override this.
+        """
+        pass
+    
 
 class StorageError(Exception):
     """Base class for all storage-related exceptions."""
@@ -65,13 +65,16 @@ def slider_int(label: str, obj: object, attr: str = None, index: Optional[int] =
     Returns:
         True if the value has changed, False otherwise.
     """
+    # Rounding is only needed for multiples other than 1, so the common case skips the conversion calls
+    round_to_multiple = (lambda x: (x // multiple) * multiple) if multiple > 1 else None
+
     return _manage_attribute_interaction(
         obj,
         attr=attr,
         index=index,
         interaction_func=lambda display_value, _: imgui.slider_int(label, display_value, min_value, max_value),
-        convert_to_display=lambda x: (x // multiple) * multiple if multiple > 1 else x,
-        convert_from_display=lambda x, _: (x // multiple) * multiple if multiple > 1 else x
+        convert_to_display=round_to_multiple,
+        convert_from_display=(lambda x, _: round_to_multiple(x)) if round_to_multiple else None
     )
 
 
@@ -120,13 +123,13 @@ def checkbox(label: str, obj: object, attr: str = None, index: Optional[IndexTyp
     )
 
 
-def list_combo(label: str, obj: object, attr: str = None, index: int = None, items: list = [] ) -> bool:
+def list_combo(label: str, obj: object, attr: str = None, index: int = None, items: Sequence = ()) -> bool:
     """
     Creates an ImGui combo box for selecting a value from a provided list, modifying an attribute of an object directly or at a specified index within a collection using a centralized attribute management function.
 
     Args:
         label (str): The label for the combo box.
-        items (list): List of items to be displayed in the combo box.
+        items (Sequence): Items to be displayed in the combo box.
         obj (object): The object containing the attribute to be updated.
         attr (str, optional): The attribute name to update. If None, `obj` should be a collection, and `index` must be specified.
         index (int, optional): The index within the collection attribute to update, applicable if `attr` points to a collection.
@@ -297,15 +300,19 @@ def _manage_attribute_interaction(obj: Any,
         target = getattr(obj, attr, default_value)
 
     if index is not None:
-        if hasattr(target, 'get'):
+        # Avoid probing the target with hasattr() first, as this runs for every widget and frame. Dicts use get(), 
+        # as missing keys are common there (e.g. default-open header states), and raising KeyError is expensive.
+        if isinstance(target, dict):
             current_value = target.get(index, default_value)
-        elif hasattr(target, '__getitem__'):
+        else:
             try:
                 current_value = target[index]
             except (IndexError, KeyError):
                 current_value = default_value
-        else:
-            raise TypeError("Indexing is attempted on a non-subscriptable object.")
+            except TypeError as e:
+                if not hasattr(target, '__getitem__'):
+                    raise TypeError("Indexing is attempted on a non-subscriptable object.") from e
+                raise
     else:
         current_value = target
 
@@ -362,6 +369,45 @@ class resized_items:
         imgui.pop_item_width()
 
 
+def clipped_range(items_count: int, item_height: Optional[float] = None) -> Iterator[int]:
+    """
+    Yields the indices of the items of a uniformly sized list that are visible in the current (scrolling) window,
+    like ImGuiListClipper, which is not exposed by pyimgui. The space of the invisible items before and after the 
+    visible range is filled with dummy items, so the scrollbar behaves as if all items were submitted.
+
+    Args:
+        items_count (int): The total number of items in the list.
+        item_height (float, optional): The height of each item including item spacing. Defaults to the height of a text line.
+
+    Yields:
+        int: The indices of the visible items.
+
+    Note:
+        The generator must be fully consumed, otherwise the space of the items after the visible range is not reserved.
+
+    Usage:
+    ```
+    for i in clipped_range(len(items)):
+        imgui.selectable(items[i])
+    ```
+    """
+    item_height = item_height or imgui.get_text_line_height_with_spacing()
+    spacing_y = imgui.get_style().item_spacing.y
+
+    # Determine the range of visible items, with one extra item to account for partially visible items
+    first = min(items_count, int(imgui.get_scroll_y() / item_height))
+    last = min(items_count, first + int(imgui.get_window_height() / item_height) + 2)
+
+    # The dummy items add their own item spacing, which is already included in the item height
+    if first > 0:
+        imgui.dummy(0, first * item_height - spacing_y)
+
+    yield from range(first, last)
+
+    if last < items_count:
+        imgui.dummy(0, (items_count - last) * item_height - spacing_y)
+
+
 def display_trimmed_path_with_tooltip(path: Union[Path, str], available_width: int = 0, margin: int = 6, ellipsis: str = '...'):
     """
     Display a trimmed path with a tooltip showing the full path.
@@ -1,4 +1,6 @@
 import logging
+import queue
+import threading
 from typing import Tuple
 import moderngl
 import numpy as np
@@ -18,7 +20,10 @@ class VideoRecorder:
     making it suitable for applications where the render window or output texture size may vary during runtime.
     
     The recorder utilizes `imageio` to handle the video file creation and data encoding, with configurable
-    parameters for video quality and format.
+    parameters for video quality and format. Frames are read from the texture on the calling thread, while
+    encoding happens on a background writer thread that consumes a queue of frames. The queue is bounded by
+    the memory of the queued frames, so it holds fewer frames at high resolutions. If the queue is full,
+    capturing blocks until the writer catches up, so no frames are dropped.
 
     Attributes:
         file_path (str): File path where the video will be saved.
@@ -27,6 +32,7 @@ class VideoRecorder:
         writer (imageio.core.format.Writer): The video writer instance used for recording frames.
         width (int): The width of the video, set when recording starts.
         height (int): The height of the video, set when recording starts.
+        max_queued_bytes (int): Maximum memory of the frames waiting to be encoded by the writer thread.
 
     Example:
         recorder = VideoRecorder('output.mp4', fps=20)
@@ -36,9 +42,13 @@ class VideoRecorder:
         recorder.stop_recording()
     """
     
-    def __init__(self) -> None:
+    def __init__(self, max_queued_bytes: int = 128 * 1024 * 1024) -> None:
         """
         Initializes a new instance of the VideoRecorder.
+
+        Parameters:
+            max_queued_bytes (int): Maximum memory of the frames waiting to be encoded by the writer thread.
+                At least one frame is queued, even if it is larger.
         """        
         self.file_path = None
         self.width = None
@@ -47,6 +57,11 @@ class VideoRecorder:
         self.codec = None
         self.writer = None
         self.frame_count = 0
+        self.max_queued_bytes = max_queued_bytes
+
+        self._frame_queue = None
+        self._writer_thread = None
+        self._writer_errors = []
 
 
     @property
@@ -114,6 +129,15 @@ class VideoRecorder:
         except Exception as e:
             raise VideoRecorderException("Failed to initialize video writer.") from e
 
+        self._writer_errors = []
+        # Each queued frame is stored as 8-bit RGB
+        self._frame_queue = queue.Queue(maxsize=max(1, self.max_queued_bytes // (width * height * 3)))
+        # The thread must not reference self, otherwise the recorder could not be finalized while recording
+        self._writer_thread = threading.Thread(target=self._write_frames, 
+                                               args=(self.writer, self._frame_queue, self._writer_errors),
+                                               name="VideoRecorderWriter", daemon=True)
+        self._writer_thread.start()
+
 
     def capture_frame(self, texture: moderngl.Texture) -> None:
         """
@@ -127,11 +151,16 @@ class VideoRecorder:
                         the dimensions specified at the start of recording.
 
         This method reads pixel data from the specified texture, validates its dimensions,
-        converts the data to the appropriate format, and appends it to the video stream.
+        converts the data to the appropriate format, and queues it for the writer thread, which
+        appends it to the video stream.
         """
         if not self.is_recording:
             raise VideoRecorderException("Video recording has not been started.")
 
+        if self._writer_errors:
+            self._abort_recording()
+            raise VideoRecorderException("Failed to write frame.") from self._writer_errors[0]
+
         try:
             texture.use()
             data = texture.read()
@@ -140,18 +169,12 @@ class VideoRecorder:
             image = np.frombuffer(data, dtype=numpy_dtype).reshape(self.height, self.width, 4)
             image_rgb = image[:, :, :3]  # Assuming the texture includes an alpha channel
             image_uint8 = np.clip(image_rgb * 255, 0, 255).astype(np.uint8)
-            self.writer.append_data(image_uint8)
+            self._frame_queue.put(image_uint8)
 
             self.frame_count += 1
 
         except Exception as e:
-            try:
-                self.writer.close()
-            except Exception as e:
-                # Log error message
-                logging.error(f"Could not close the video writer during exception handling: {e}")
-
-            self.writer = None
+            self._abort_recording()
             raise VideoRecorderException("Failed to capture frame.") from e
 
 
@@ -159,14 +182,18 @@ class VideoRecorder:
         """
         Stops the video recording and finalizes the video file.
 
-        Closes the video writer and ensures that all data is flushed and the file is
-        properly finalized. This method should be called to properly close the video file
-        after all frames have been captured.
+        Waits until the writer thread has encoded all queued frames, then closes the video writer 
+        and ensures that all data is flushed and the file is properly finalized. This method should 
+        be called to properly close the video file after all frames have been captured.
+
+        This blocks the calling thread until the file is finalized, which can take a moment when
+        many high resolution frames are still queued.
         """
         if not self.is_recording:
             raise VideoRecorderException("No active recording to stop.")
 
         try:
+            self._stop_writer_thread()
             self.writer.close()
             logging.debug(f"Video recording stopped. {self.frame_count} frames captured.")
 
@@ -175,6 +202,52 @@ class VideoRecorder:
         finally:
             self.writer = None
 
+        if self._writer_errors:
+            raise VideoRecorderException("Failed to write frame.") from self._writer_errors[0]
+
+
+    @staticmethod
+    def _write_frames(writer, frame_queue: queue.Queue, errors: list) -> None:
+        """
+        Runs on the writer thread and appends queued frames to the video, until it receives None.
+        
+        After an error, the remaining frames are discarded, so the capturing thread never blocks 
+        on a full queue. The error is appended to errors and reported by the next call to capture_frame 
+        or stop_recording.
+        """
+        while (frame := frame_queue.get()) is not None:
+            if not errors:
+                try:
+                    writer.append_data(frame)
+                except Exception as e:
+                    errors.append(e)
+
+
+    def _stop_writer_thread(self) -> None:
+        """
+        Signals the writer thread to finish after all queued frames and waits for it to exit.
+        """
+        if self._writer_thread is not None:
+            self._frame_queue.put(None)
+            self._writer_thread.join()
+
+        self._writer_thread = None
+        self._frame_queue = None
+
+
+    def _abort_recording(self) -> None:
+        """
+        Stops the writer thread and closes the video writer after an error.
+        """
+        try:
+            self._stop_writer_thread()
+            self.writer.close()
+        except Exception as e:
+            # Log error message
+            logging.error(f"Could not close the video writer during exception handling: {e}")
+
+        self.writer = None
+
 
     def __del__(self) -> None:
         """
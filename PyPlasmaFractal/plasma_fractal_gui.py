@@ -5,6 +5,7 @@ import math
 import os
 from pathlib import Path
 import platform
+import subprocess
 from typing import *
 import imgui
  
@@ -12,22 +13,33 @@ from PyPlasmaFractal.mylib.config.config_path_manager import ConfigPathManager
 from PyPlasmaFractal.mylib.config.function_info import FunctionParam
 from PyPlasmaFractal.mylib.config.json_file_storage import JsonFileStorage
 from PyPlasmaFractal.mylib.config.source_manager import StorageSourceManager
-from PyPlasmaFractal.mylib.config.function_registry import FunctionRegistry, ParamType
+from PyPlasmaFractal.mylib.config.function_registry import FunctionRegistry
 from PyPlasmaFractal.mylib.gui.ansi_style import AnsiStyle
 from PyPlasmaFractal.mylib.gui.icons import Icons
 from PyPlasmaFractal.mylib.gui.notification_manager import NotificationManager
 from PyPlasmaFractal.mylib.gui.window_fade_manager import WindowFadeManager
 import PyPlasmaFractal.mylib.gui.imgui_helper as ih
-from PyPlasmaFractal.mylib.color.adjust_color import modify_rgba_color_hsv, sigmoid_contrast
+from PyPlasmaFractal.mylib.color.adjust_color import modify_rgba_color_hsv_cached, sigmoid_contrast
 from PyPlasmaFractal.plasma_fractal_types import ShaderFunctionType
 from .plasma_fractal_params import PlasmaFractalParams
 
+# Widget flags that are used on every frame, resolved once at import time
+LOG_SLIDER_FLAGS = imgui.SLIDER_FLAGS_LOGARITHMIC
+COLOR_EDIT_FLAGS = imgui.COLOR_EDIT_FLOAT | imgui.COLOR_EDIT_ALPHA_BAR
+
+# Upper limit of the rotation slider (a full turn)
+TWO_PI = math.pi * 2
+
+# Name of the operating system, used to choose the file explorer command
+PLATFORM_SYSTEM = platform.system()
+
 class PlasmaFractalGUI:
     """
     Manages the user interface for PyPlasmaFractal.
       
     Attributes:
         preset_list (List[Preset]): A list of available presets, populated on-demand.
+        preset_display_names (List[str]): The names shown in the preset list, in the same order as preset_list.
         selected_preset_index (int): The index of the currently selected preset in the list.
         animation_paused (bool): Flag to indicate whether the animation is paused.
         noise_settings_open (bool): Flag to control the visibility of the noise settings.
@@ -47,6 +59,20 @@ class PlasmaFractalGUI:
         RECORDING_ERROR = auto()           # Received by the GUI when an error occurs during recording
         LOAD_CONFIG_ERROR = auto()         # Received by the GUI when an error occurs while loading the configuration
 
+    # Common video resolutions
+    COMMON_RESOLUTIONS = {
+        'HD 720p'      : (1280,  720),
+        'Full HD 1080p': (1920, 1080),
+        '2K'           : (2560, 1440),
+        '4K UHD'       : (3840, 2160),
+        '8K UHD'       : (7680, 4320),
+        'Custom'       : None  # This will trigger custom resolution input
+    }
+    RESOLUTION_NAMES = tuple(COMMON_RESOLUTIONS.keys())
+
+    # Common video frame rates
+    COMMON_FRAME_RATES = (24, 30, 60, 120)
+
     def __init__(self, path_manager: ConfigPathManager, 
                  function_registries: Dict[ShaderFunctionType, FunctionRegistry],
                  recording_directory: Union[Path, str], 
@@ -58,6 +84,9 @@ class PlasmaFractalGUI:
         self.color_function_registry = function_registries[ShaderFunctionType.COLOR]
      
         self.animation_paused = False
+
+        # The hint shown while feedback is disabled, is only shown until feedback is enabled for the first time
+        self.feedback_hint_dismissed = False
         
         # Initialize the visibility state for the different settings tabs
         self.noise_settings_open = True
@@ -69,8 +98,13 @@ class PlasmaFractalGUI:
         self.feedback_color_adjustment_open = True
         self.color_function_settings_open = True
 
+        # Visibility state of the parameter groups of the function settings, keyed by (header_attr, group index).
+        # Groups that are missing from the dictionary are open.
+        self.function_group_settings_open: Dict[Tuple[str, int], bool] = {}
+
         # Initialize preset management
         self.preset_list = []
+        self.preset_display_names = []
         self.selected_preset_index = -1
         self.current_preset_name = "new_file"
         self.preset_error_message = None
@@ -81,7 +115,8 @@ class PlasmaFractalGUI:
 
         # Initialize recording state
         self.recording_directory = Path(recording_directory)
-        self.recording_file_name = f"Capture_{datetime.datetime.now().strftime('%y%m%d_%H%M')}.mp4"
+        self.recording_file_name = None    # Generated from the current time when the Recording tab is shown
+        self._generated_recording_file_name = None
         self.recording_fps = default_recording_fps
         self.recording_last_saved_file_path = None
         self.recording_resolution = 'HD 720p'
@@ -104,6 +139,13 @@ class PlasmaFractalGUI:
         # Initialize the notification manager
         self.notifications = NotificationManager[self.Notification]()
 
+        # Available content width of the control panel, queried once per frame in update()
+        self._content_width = 0.0
+
+        # Caches for the function selection combo boxes, as the function registries are static
+        self._sorted_functions_cache: Dict[FunctionRegistry, Tuple[List[str], List[str]]] = {}
+        self._function_tooltip_cache: Dict[Tuple[FunctionRegistry, str], str] = {}
+
 
     # .......................... UI update methods ...........................................................................
 
@@ -117,16 +159,30 @@ class PlasmaFractalGUI:
         Args:
             params (PlasmaFractalParams): The current settings of the plasma fractal that can be adjusted via the UI.
         """
+        # Recording state must be tracked, even if the recording tab or the whole control panel is not visible
+        self.handle_recording_state()
+
+        # Fade the control panel in or out based on mouse activity
+        self.fade_manager.update(imgui.get_mouse_pos(), imgui.is_window_focused(imgui.FOCUS_ANY_WINDOW))
+
+        # Skip the control panel entirely while it is faded out, as it would be invisible anyway
+        if self.fade_manager.alpha <= 0.0:
+            return
+
         style = imgui.get_style()
-        new_hdr_color = modify_rgba_color_hsv(style.colors[imgui.COLOR_HEADER], -0.05, 1.0, 1.0)
+        new_hdr_color = modify_rgba_color_hsv_cached(style.colors[imgui.COLOR_HEADER], -0.05, 1.0, 1.0)
 
         with imgui.styled(imgui.STYLE_ALPHA, self.fade_manager.alpha), imgui.colored(imgui.COLOR_HEADER, *new_hdr_color):
 
             imgui.set_next_window_size(400, 800, imgui.FIRST_USE_EVER)
-            with imgui.begin("Control Panel"):
+            with imgui.begin("Control Panel") as window:
+
+                # Skip all controls while the window is collapsed, as ImGui would discard them anyway
+                if not window.expanded:
+                    return
 
-                # Fade the control panel in or out based on mouse activity
-                self.fade_manager.update(imgui.get_mouse_pos(), imgui.is_window_focused(imgui.FOCUS_ANY_WINDOW))
+                # Query the content width only once per frame, the tab handlers reuse it
+                self._content_width = imgui.get_content_region_available_width()
 
                 # Display the "Reset to Defaults" button and handle the confirmation dialog
                 self.show_reset_button_and_confirm_dialog(params)
@@ -134,36 +190,40 @@ class PlasmaFractalGUI:
                 # Display the current FPS in the same line as the "Reset to Defaults" button
                 self.display_fps_same_line()
 
-                width = imgui.get_content_region_available_width()
-
-                imgui.set_next_item_width(width - 160)
-                ih.slider_float("Speed", params, 'speed', min_value=0.01, max_value=10.0, flags=imgui.SLIDER_FLAGS_LOGARITHMIC)
+                imgui.set_next_item_width(self._content_width - 160)
+                ih.slider_float("Speed", params, 'speed', min_value=0.01, max_value=10.0, flags=LOG_SLIDER_FLAGS)
 
                 imgui.same_line()
                 ih.checkbox("Paused", self, attr='animation_paused')
                 imgui.spacing()
 
-                with imgui.begin_tab_bar("Control Tabs") as tab_bar:
-                    if tab_bar.opened:
-                        with imgui.begin_tab_item("Noise") as noise_tab:
-                            if noise_tab.selected:
-                                self.handle_noise_tab(params)
+                # Explicit begin/end calls, like the tab items, avoid the context manager protocol on every frame
+                if imgui.begin_tab_bar("Control Tabs").opened:
+                    # Only the selected tab item must be ended, unselected tabs skip their handler entirely.
+                    # Common item width of the parameter tabs, pushed once instead of in each tab handler.
+                    with ih.resized_items(-160):
+
+                        if imgui.begin_tab_item("Noise").selected:
+                            self.handle_noise_tab(params)
+                            imgui.end_tab_item()
 
-                        with imgui.begin_tab_item("Color") as color_tab:
-                            if color_tab.selected:
-                                self.handle_color_tab(params)
+                        if imgui.begin_tab_item("Color").selected:
+                            self.handle_color_tab(params)
+                            imgui.end_tab_item()
 
-                        with imgui.begin_tab_item("Feedback") as feedback_tab:
-                            if feedback_tab.selected:
-                                self.handle_feedback_tab(params)
+                        if imgui.begin_tab_item("Feedback").selected:
+                            self.handle_feedback_tab(params)
+                            imgui.end_tab_item()
 
-                        with imgui.begin_tab_item("Presets") as presets_tab:
-                            if presets_tab.selected:
-                                self.handle_presets_tab(params)
+                    if imgui.begin_tab_item("Presets").selected:
+                        self.handle_presets_tab(params)
+                        imgui.end_tab_item()
 
-                        with imgui.begin_tab_item("Recording") as recording_tab:
-                            if recording_tab.selected:
-                                self.handle_recording_tab(params)
+                    if imgui.begin_tab_item("Recording").selected:
+                        self.handle_recording_tab(params)
+                        imgui.end_tab_item()
+
+                    imgui.end_tab_bar()
 
     
     def show_reset_button_and_confirm_dialog(self, params: PlasmaFractalParams):
@@ -196,11 +256,10 @@ class PlasmaFractalGUI:
             color = (1.0, 0.9, 0.2)
             fps_text = "FPS: N/A"
         
-        content_width = imgui.get_content_region_available_width()
         fps_text_width = imgui.calc_text_size(fps_text)[0]
 
         # Add spacing to align FPS text to the right
-        imgui.same_line(content_width - fps_text_width)
+        imgui.same_line(self._content_width - fps_text_width)
         imgui.text_colored(fps_text, *color)
           
         imgui.spacing()                
@@ -214,28 +273,26 @@ class PlasmaFractalGUI:
             params (PlasmaFractalParams): The current settings of the plasma fractal that can be adjusted via the UI.
         """
                
-        with ih.resized_items(-160):
-
-            if ih.collapsing_header("Noise Settings", self, attr='noise_settings_open'):
-                self.noise_controls(params.noise, 'noise')
+        if ih.collapsing_header("Noise Settings", self, attr='noise_settings_open'):
+            self.noise_controls(params.noise, 'noise')
 
-            if ih.collapsing_header("Output Settings", self, attr='output_settings_open'):
-                
-                ih.slider_float("Brightness", params, 'brightness', min_value=0.0, max_value=2.0)
-                ih.show_tooltip("Adjust the brightness of the rendered noise.\n"
-                                "Higher values increase the overall intensity of the noise pattern.")
-                
-                ih.slider_float("Contrast", params, 'contrast_steepness', min_value=0.001, max_value=50.0)
-                ih.show_tooltip("Set the contrast steepness of the rendered noise.\n"
-                                "Higher values result in sharper contrasts between light and dark areas.")
-                
-                ih.slider_float("Contrast Midpoint", params, 'contrast_midpoint', min_value=0.0, max_value=1.0)
-                ih.show_tooltip("Adjust the midpoint for contrast adjustments.\n"
-                                "Higher values shift the midpoint towards the brighter end of the intensity range.")
+        if ih.collapsing_header("Output Settings", self, attr='output_settings_open'):
+            
+            ih.slider_float("Brightness", params, 'brightness', min_value=0.0, max_value=2.0)
+            ih.show_tooltip("Adjust the brightness of the rendered noise.\n"
+                            "Higher values increase the overall intensity of the noise pattern.")
+            
+            ih.slider_float("Contrast", params, 'contrast_steepness', min_value=0.001, max_value=50.0)
+            ih.show_tooltip("Set the contrast steepness of the rendered noise.\n"
+                            "Higher values result in sharper contrasts between light and dark areas.")
+            
+            ih.slider_float("Contrast Midpoint", params, 'contrast_midpoint', min_value=0.0, max_value=1.0)
+            ih.show_tooltip("Adjust the midpoint for contrast adjustments.\n"
+                            "Higher values shift the midpoint towards the brighter end of the intensity range.")
 
-                ih.plot_callable('##output_curve', 
-                                 lambda x: sigmoid_contrast(x, params.contrast_steepness, params.contrast_midpoint) * params.brightness, 
-                                 scale_max=2.0)
+            ih.plot_callable('##output_curve', 
+                             lambda x: sigmoid_contrast(x, params.contrast_steepness, params.contrast_midpoint) * params.brightness, 
+                             scale_max=2.0)
 
 
     def handle_feedback_tab(self, params: PlasmaFractalParams):
@@ -248,9 +305,11 @@ class PlasmaFractalGUI:
         ih.checkbox("Enable Feedback", params, 'enable_feedback')
 
         if params.enable_feedback:
+            # The user has seen the effect of feedback now, so the hint isn't needed anymore
+            self.feedback_hint_dismissed = True
             imgui.spacing()
             self.handle_feedback_controls(params)
-        else:
+        elif not self.feedback_hint_dismissed:
             imgui.spacing()
             imgui.spacing()
             imgui.text_colored("Note", 1.0, 0.9, 0.2)
@@ -265,25 +324,23 @@ class PlasmaFractalGUI:
         Args:
             params (PlasmaFractalParams): The current settings of the plasma fractal, specifically for configuring feedback effects.
         """
-        with ih.resized_items(-160):
+        self.function_settings(header="Feedback Mix Settings", header_attr='feedback_general_settings_open', 
+                               registry=self.blend_function_registry, function_attr='feedback_function', params_attr='feedback_params', 
+                               params=params)
 
-            self.function_settings(header="Feedback Mix Settings", header_attr='feedback_general_settings_open', 
-                                   registry=self.blend_function_registry, function_attr='feedback_function', params_attr='feedback_params', 
-                                   params=params)
+        if ih.collapsing_header("Feedback Blur Settings", self, attr='feedback_blur_settings_open'):
+                               
+            ih.checkbox("Enable Blur", params, 'enable_feedback_blur')
+            if params.enable_feedback_blur:
+                ih.slider_int("Blur Radius", params, 'feedback_blur_radius', min_value=1, max_value=16)
+                ih.slider_float("Blur Radius Power", params, 'feedback_blur_radius_power', min_value=0.01, max_value=20, flags=LOG_SLIDER_FLAGS)
 
-            if ih.collapsing_header("Feedback Blur Settings", self, attr='feedback_blur_settings_open'):
-                                   
-                ih.checkbox("Enable Blur", params, 'enable_feedback_blur')
-                if params.enable_feedback_blur:
-                    ih.slider_int("Blur Radius", params, 'feedback_blur_radius', min_value=1, max_value=16)
-                    ih.slider_float("Blur Radius Power", params, 'feedback_blur_radius_power', min_value=0.01, max_value=20, flags=imgui.SLIDER_FLAGS_LOGARITHMIC)
-      
-            if ih.collapsing_header("Warp Noise Settings", self, attr='feedback_warp_noise_settings_open'):
-                self.noise_controls(params.warp_noise, 'warp_noise')
+        if ih.collapsing_header("Warp Noise Settings", self, attr='feedback_warp_noise_settings_open'):
+            self.noise_controls(params.warp_noise, 'warp_noise')
 
-            self.function_settings(header="Warp Function Settings", header_attr='feedback_warp_effect_settings_open', 
-                                   registry=self.warp_function_registry, function_attr='warp_function', params_attr='warp_params',
-                                   params=params)
+        self.function_settings(header="Warp Function Settings", header_attr='feedback_warp_effect_settings_open', 
+                               registry=self.warp_function_registry, function_attr='warp_function', params_attr='warp_params',
+                               params=params)
 
 
     def noise_controls(self, noise_params, unique_id: str):
@@ -294,37 +351,42 @@ class PlasmaFractalGUI:
             noise_params: The noise parameters object to modify
             unique_id: Used to create unique control IDs
         """
-        self.function_combo(f"Noise Algorithm##{unique_id}", noise_params, 'noise_algorithm', self.noise_function_registry)
+        # Scope the IDs of the controls by the unique ID, so the labels don't have to be formatted on every frame
+        imgui.push_id(unique_id)
 
-        ih.slider_float("Speed##{unique_id}", noise_params, 'speed', min_value=0.01, max_value=10.0)
+        self.function_combo("Noise Algorithm", noise_params, 'noise_algorithm', self.noise_function_registry)
+
+        ih.slider_float("Speed", noise_params, 'speed', min_value=0.01, max_value=10.0)
         ih.show_tooltip("Adjust the speed of the noise.\n"
                        "Higher values result in faster movement of the noise pattern.")
         
-        ih.slider_float("Scale##{unique_id}", noise_params, 'scale', min_value=0.01, max_value=100.0, flags=imgui.SLIDER_FLAGS_LOGARITHMIC)
+        ih.slider_float("Scale", noise_params, 'scale', min_value=0.01, max_value=100.0, flags=LOG_SLIDER_FLAGS)
         ih.show_tooltip("Adjust the scale of the noise.")
       
-        ih.slider_int("Num. Octaves##{unique_id}", noise_params, 'octaves', min_value=1, max_value=12)
+        ih.slider_int("Num. Octaves", noise_params, 'octaves', min_value=1, max_value=12)
         ih.show_tooltip("Set the number of noise octaves for fractal generation.\n"
-                         "Higher values increase detail but can be computationally intensive.")
+                       "Higher values increase detail but can be computationally intensive.")
         
-        ih.slider_float("Gain/Octave##{unique_id}", noise_params, 'gain', min_value=0.1, max_value=1.0)
+        ih.slider_float("Gain/Octave", noise_params, 'gain', min_value=0.1, max_value=1.0)
         ih.show_tooltip("Adjust the gain applied to the noise value produced by each octave.\n"
-                         "A typical value is 0.5, which reduces the influence of higher octaves.")
+                       "A typical value is 0.5, which reduces the influence of higher octaves.")
         
-        ih.slider_float("Pos. Scale/Octave##{unique_id}", noise_params, 'position_scale_factor', min_value=0.1, max_value=10.0)
+        ih.slider_float("Pos. Scale/Octave", noise_params, 'position_scale_factor', min_value=0.1, max_value=10.0)
         ih.show_tooltip("Adjust the position scale applied to each octave.\n"
-                         "A typical value is 2.0, which allows each octave to contribute smaller details.")
+                       "A typical value is 2.0, which allows each octave to contribute smaller details.")
         
-        ih.slider_float("Rotation/Octave##{unique_id}", noise_params, 'rotation_angle_increment', min_value=0.0, max_value=math.pi * 2, flags=imgui.SLIDER_FLAGS_LOGARITHMIC)
+        ih.slider_float("Rotation/Octave", noise_params, 'rotation_angle_increment', min_value=0.0, max_value=TWO_PI, flags=LOG_SLIDER_FLAGS)
         ih.show_tooltip("Adjust the rotation angle increment applied to each octave.")
         
-        ih.slider_float("Time Scale/Octave##{unique_id}", noise_params, 'time_scale_factor', min_value=0.1, max_value=2.0)
+        ih.slider_float("Time Scale/Octave", noise_params, 'time_scale_factor', min_value=0.1, max_value=2.0)
         ih.show_tooltip("Adjust the time scale factor applied to each octave.\n"
-                         "Higher values speed up the temporal changes of each octave.")
+                       "Higher values speed up the temporal changes of each octave.")
         
-        ih.slider_float("Time Offset/Octave##{unique_id}", noise_params, 'time_offset_increment', min_value=0.0, max_value=20.0)
+        ih.slider_float("Time Offset/Octave", noise_params, 'time_offset_increment', min_value=0.0, max_value=20.0)
         ih.show_tooltip("Adjust the time offset increment applied to each octave,\n"
-                         "to increase noise variation.")
+                       "to increase noise variation.")
+
+        imgui.pop_id()
 
 
     def handle_color_tab(self, params: PlasmaFractalParams):
@@ -335,11 +397,9 @@ class PlasmaFractalGUI:
             params (PlasmaFractalParams): The current settings of the plasma fractal that can be adjusted via the UI.
         """
               
-        with ih.resized_items(-160):
-
-            self.function_settings(header="Color Function Settings", header_attr='color_function_settings_open', 
-                                    registry=self.color_function_registry, function_attr='color_function', params_attr='color_params', 
-                                    params=params)
+        self.function_settings(header="Color Function Settings", header_attr='color_function_settings_open', 
+                                registry=self.color_function_registry, function_attr='color_function', params_attr='color_params', 
+                                params=params)
 
 
     def function_combo(self, combo_label: str, params: PlasmaFractalParams, params_attr: str, registry: FunctionRegistry):
@@ -353,6 +413,38 @@ class PlasmaFractalGUI:
             params_attr (str): The attribute of the params object to update.
             registry (FunctionRegistry): The function registry containing the functions.
         """
+        sorted_display_names, sorted_keys = self.get_sorted_functions(registry)
+
+        # Find the current index based on the function key stored in params
+        current_key = getattr(params, params_attr)
+        current_index = sorted_keys.index(current_key) if current_key in sorted_keys else 0
+
+        # Display the combo box with display names and update the selected key in params
+        imgui.push_id(params_attr)
+        changed, selected_index = imgui.combo(combo_label, current_index, sorted_display_names)
+        imgui.pop_id()
+
+        if changed:
+            setattr(params, params_attr, sorted_keys[selected_index])
+            
+        # Show a tooltip with details of all available functions in sorted order
+        ih.show_tooltip(self.get_function_tooltip(registry, current_key))
+
+
+    def get_sorted_functions(self, registry: FunctionRegistry) -> Tuple[List[str], List[str]]:
+        """
+        Returns the display names and keys of all functions of the registry, sorted by display name.
+        The result is cached, as the registries don't change while the application is running.
+
+        Args:
+            registry (FunctionRegistry): The function registry containing the functions.
+
+        Returns:
+            Tuple[List[str], List[str]]: The sorted display names and the function keys in the same order.
+        """
+        if (cached := self._sorted_functions_cache.get(registry)) is not None:
+            return cached
+
         # Retrieve all function keys and their display names
         function_keys = registry.get_function_keys()
         function_display_names = [registry.get_function_info(key).display_name for key in function_keys]
@@ -363,28 +455,28 @@ class PlasmaFractalGUI:
         # Unzip the sorted tuples into separate lists
         sorted_display_names, sorted_keys = zip(*sorted_functions)
 
-        # Convert the tuples to lists
-        sorted_display_names = list(sorted_display_names)
-        sorted_keys = list(sorted_keys)
+        result = (list(sorted_display_names), list(sorted_keys))
+        self._sorted_functions_cache[registry] = result
+        return result
 
-        # Find the current index based on the function key stored in params
-        current_key = getattr(params, params_attr)
-        current_index = sorted_keys.index(current_key) if current_key in sorted_keys else 0
 
-        # Display the combo box with display names and update the selected key in params
-        changed, selected_index = imgui.combo(f"{combo_label}##{params_attr}", current_index, sorted_display_names)
+    def get_function_tooltip(self, registry: FunctionRegistry, current_key: str) -> str:
+        """
+        Returns the tooltip text that describes all functions of the registry, highlighting the current function.
+        The text is cached per registry and current function.
+        """
+        cache_key = (registry, current_key)
+        if (cached := self._function_tooltip_cache.get(cache_key)) is not None:
+            return cached
 
-        if changed:
-            setattr(params, params_attr, sorted_keys[selected_index])
-            
-        # Show a tooltip with details of all available functions in sorted order
         tooltip_text = f"# {registry.description}\n"
-        for key in sorted_keys:
+        for key in self.get_sorted_functions(registry)[1]:
             color = AnsiStyle.FG_BRIGHT_YELLOW if key == current_key else AnsiStyle.FG_BRIGHT_CYAN
             func_info = registry.get_function_info(key)
             tooltip_text += f"\n- {color}{func_info.display_name}{AnsiStyle.RESET} - {func_info.description}"
 
-        ih.show_tooltip(tooltip_text)        
+        self._function_tooltip_cache[cache_key] = tooltip_text
+        return tooltip_text
         
 
     def function_settings(self, 
@@ -399,36 +491,35 @@ class PlasmaFractalGUI:
         
         if ih.collapsing_header(header, self, attr=header_attr):
             
+            # Scope the IDs of the controls by the header, so the plain display names can be used as labels
+            imgui.push_id(header)
+
             # Dropdown for the available functions 
-            self.function_combo(f"Function##{function_attr}", params, function_attr, registry)        
+            self.function_combo("Function", params, function_attr, registry)        
                       
             selected_function = getattr(params, function_attr)
             function_info = registry.get_function_info(selected_function)
             function_params_dict = getattr(params, params_attr)
             function_params = function_params_dict[selected_function]
-            
-            # Create unique attribute names for each group's header state
-            group_state_prefix = f"{header_attr}_group_"
-            
+
             # Display parameters by groups
             for i, group in enumerate(function_info.param_groups):
                 
                 # If group name is empty, display parameters directly under the main header
                 if not group.display_name:
                     for param_info in group.params:
-                        self.param_control(param_info, function_params, header)
+                        self.param_control(param_info, function_params)
                     continue
                 
-                group_state_attr = f"{group_state_prefix}{i}"
-                if not hasattr(self, group_state_attr):
-                    setattr(self, group_state_attr, True)  # Initialize group state if not exists
-                
-                if ih.collapsing_header(group.display_name, self, attr=group_state_attr, flags=imgui.TREE_NODE_DEFAULT_OPEN):
+                if ih.collapsing_header(group.display_name, self.function_group_settings_open, index=(header_attr, i), 
+                                        flags=imgui.TREE_NODE_DEFAULT_OPEN):
                     for param_info in group.params:
-                        self.param_control(param_info, function_params, header)
+                        self.param_control(param_info, function_params)
+
+            imgui.pop_id()
 
 
-    def param_control(self, param_info: FunctionParam, function_params: Dict, header: str):
+    def param_control(self, param_info: FunctionParam, function_params: Dict):
         """Display the appropriate control for a parameter based on its type."""
         
         param_name = param_info.name
@@ -436,7 +527,7 @@ class PlasmaFractalGUI:
         match param_info.param_type.name:
             case 'int':
                 changed, new_value = imgui.slider_int(
-                    f"{param_info.display_name}##{header}", 
+                    param_info.display_name, 
                     function_params[param_name], 
                     param_info.min, 
                     param_info.max
@@ -446,20 +537,20 @@ class PlasmaFractalGUI:
             
             case 'float':
                 changed, new_value = imgui.slider_float(
-                    f"{param_info.display_name}##{header}", 
+                    param_info.display_name, 
                     function_params[param_name], 
                     param_info.min, 
                     param_info.max,
-                    flags=imgui.SLIDER_FLAGS_LOGARITHMIC if getattr(param_info, 'logarithmic', False) else 0
+                    flags=LOG_SLIDER_FLAGS if getattr(param_info, 'logarithmic', False) else 0
                 )
                 if changed:
                     function_params[param_name] = new_value
             
             case 'color':
                 changed, new_value = imgui.color_edit4(
-                    f"{param_info.display_name}##{header}",
+                    param_info.display_name,
                     *function_params[param_name],
-                    flags=imgui.COLOR_EDIT_FLOAT | imgui.COLOR_EDIT_ALPHA_BAR
+                    flags=COLOR_EDIT_FLAGS
                 )
                 if changed:
                     function_params[param_name] = list(new_value)
@@ -507,19 +598,26 @@ class PlasmaFractalGUI:
         Returns:
             None
         """
-        width = imgui.get_content_region_available_width()
+        width = self._content_width
 
         imgui.spacing()
         imgui.text("Available Presets (* marks built-ins):")
+        imgui.same_line()
+        if imgui.small_button("Refresh"):
+            # Picks up presets that were added or removed outside of the application. The cached listings are
+            # discarded, as external changes are not always detectable by the directory modification time.
+            self.storage_manager.invalidate_cache()
+            self.update_presets_list()
         imgui.spacing()
 
         if imgui.begin_list_box("##AvailablePresets", width, 450):
             
-            for i, preset in enumerate(self.preset_list):
-                
-                display_name = f"* {preset.name}" if preset.storage == self.storage_manager.app_storage else preset.name
+            # Only the visible presets are submitted, so the list scales to any number of presets
+            for i in ih.clipped_range(len(self.preset_list)):
+
+                preset = self.preset_list[i]
                 
-                opened, _ = imgui.selectable(display_name, self.selected_preset_index == i, flags=imgui.SELECTABLE_ALLOW_DOUBLE_CLICK)
+                opened, _ = imgui.selectable(self.preset_display_names[i], self.selected_preset_index == i, flags=imgui.SELECTABLE_ALLOW_DOUBLE_CLICK)
 
                 if opened:
                     self.selected_preset_index = i
@@ -577,8 +675,8 @@ class PlasmaFractalGUI:
 
         # Shows the confirmation dialog if triggered by open_popup().
         # Note: this needs to be on the same level as the button, otherwise the popup won't work
-        if self.confirm_dialog(f'A preset with this name already exists:\n"{self.current_preset_name}"\n\nDo you want to overwrite it?',
-                               confirm_dlg_title):
+        if self.confirm_dialog('A preset with this name already exists:\n"{}"\n\nDo you want to overwrite it?',
+                               confirm_dlg_title, self.current_preset_name):
 
             self.save_preset(params)
             
@@ -600,7 +698,8 @@ class PlasmaFractalGUI:
                 imgui.open_popup("Confirm Deletion")
 
             # Confirmation popup logic
-            if self.confirm_dialog(f'Are you sure you want to delete the preset "{self.current_preset_name}" ?', "Confirm Deletion"):
+            if self.confirm_dialog('Are you sure you want to delete the preset "{}" ?', "Confirm Deletion",
+                                   self.current_preset_name):
                 self.delete_selected_preset()
  
 
@@ -630,24 +729,28 @@ class PlasmaFractalGUI:
         Opens the presets directory in the system's default file explorer.
         """
         try:
-            if platform.system() == "Windows":
+            if PLATFORM_SYSTEM == "Windows":
                 os.startfile(directory)
-            elif platform.system() == "Darwin":  # macOS
-                os.system(f'open "{directory}"')
+            elif PLATFORM_SYSTEM == "Darwin":  # macOS
+                subprocess.Popen(['open', str(directory)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
             else:  # Assume Linux
-                os.system(f'xdg-open "{directory}"')
+                subprocess.Popen(['xdg-open', str(directory)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
         except Exception as e:
             logging.error(f"Failed to open directory: {e}")
             
 
-    def confirm_dialog(self, message: str, title: str) -> bool:
+    def confirm_dialog(self, message: str, title: str, *message_args) -> bool:
         """
         Displays a confirmation dialog with a message and buttons for the user to confirm or cancel.
 
         Args:
-            message (str): The message to display in the dialog.
+            message (str): The message to display in the dialog. If message_args are given, this is a format string
+                           that is only formatted while the dialog is open.
             id (str, optional): An optional identifier for the dialog. Defaults to None.
             title (str, optional): The title of the dialog. Defaults to "Confirm Overwrite".
+            *message_args: Optional arguments for formatting the message.
 
         Returns:
             bool: True if the user confirmed, False otherwise.
@@ -658,6 +761,8 @@ class PlasmaFractalGUI:
         if imgui.begin_popup_modal(title, flags=imgui.WINDOW_ALWAYS_AUTO_RESIZE)[0]:
 
             imgui.spacing()
+            if message_args:
+                message = message.format(*message_args)
             imgui.text(f'{Icons.WARNING} {message}')
             imgui.spacing()
 
@@ -686,8 +791,14 @@ class PlasmaFractalGUI:
     def update_presets_list(self):
         """
         Updates the internal list of presets from both app-specific and user-specific directories.
+        Built-in presets are listed first, each group sorted case-insensitively by name.
         """
-        self.preset_list = self.storage_manager.list()
+        self.preset_list = sorted(self.storage_manager.list(), 
+                                  key=lambda preset: (preset.storage != self.app_storage, preset.name.lower()))
+
+        # Built-in presets are marked with an asterisk
+        self.preset_display_names = [f"* {preset.name}" if preset.storage == self.app_storage else preset.name
+                                     for preset in self.preset_list]
         
         self.selected_preset_index = -1
 
@@ -770,7 +881,12 @@ class PlasmaFractalGUI:
 
         with ih.resized_items(-120):
 
-            available_width = imgui.get_content_region_available_width()
+            available_width = self._content_width
+
+            # Generate a time-stamped file name, unless the user has one already
+            if self.recording_file_name is None:
+                self.recording_file_name = f"Capture_{datetime.datetime.now():%y%m%d_%H%M}.mp4"
+                self._generated_recording_file_name = self.recording_file_name
 
             # Filename input
             if ih.input_text("Filename", self, 'recording_file_name', buffer_size=256):
@@ -778,21 +894,11 @@ class PlasmaFractalGUI:
                 if not self.recording_file_name.lower().endswith('.mp4'):
                     self.recording_file_name += '.mp4'
 
-            # Common video resolutions
-            common_resolutions = {
-                'HD 720p'      : (1280,  720),
-                'Full HD 1080p': (1920, 1080),
-                '2K'           : (2560, 1440),
-                '4K UHD'       : (3840, 2160),
-                '8K UHD'       : (7680, 4320),
-                'Custom'       : None  # This will trigger custom resolution input
-            }
-            resolution_names = list(common_resolutions.keys())
-
             # Resolution combo box refactored to use list_combo helper
-            ih.list_combo("Resolution", self, 'recording_resolution', items=resolution_names)
+            ih.list_combo("Resolution", self, 'recording_resolution', items=self.RESOLUTION_NAMES)
 
-            if self.recording_resolution == 'Custom':
+            resolution = self.COMMON_RESOLUTIONS[self.recording_resolution]
+            if resolution is None:
                 # Input fields for custom resolution
                 ih.input_int("Width", self, 'recording_width',  step=1, step_fast=10)
                 ih.input_int("Height", self, 'recording_height', step=1, step_fast=10)
@@ -800,11 +906,10 @@ class PlasmaFractalGUI:
                 self.recording_height = max(2, self.recording_height)
             else:
                 # Update resolution from predefined resolutions
-                self.recording_width, self.recording_height = common_resolutions[self.recording_resolution]
+                self.recording_width, self.recording_height = resolution
 
             # Frame rates combo box
-            common_frame_rates = [24, 30, 60, 120]
-            ih.list_combo("Frame Rate", obj=self, attr='recording_fps', items=common_frame_rates)
+            ih.list_combo("Frame Rate", obj=self, attr='recording_fps', items=self.COMMON_FRAME_RATES)
             
             # Recording quality input
             ih.slider_int("Quality", self, 'recording_quality', min_value=1, max_value=10)
@@ -819,20 +924,12 @@ class PlasmaFractalGUI:
             # Start/Stop recording toggle button
             self.handle_recording_button()
 
-            # Automatic stop check
-            self.handle_automatic_stop()
-
             # Display recording time if recording
             if self.is_recording and self.recording_time is not None:
                 imgui.spacing()
                 recording_time_str = self.convert_seconds_to_hms(self.recording_time)
                 imgui.text_colored(f"Recording... {recording_time_str}", 1.0, 0.2, 1.0)
 
-            # Check for recording errors
-            if (message := self.notifications.pull_notification(self.Notification.RECORDING_ERROR)) is not None:
-                self.is_recording = False
-                self.recording_error_message = message
-
             if not self.is_recording:
                 imgui.spacing()
                 imgui.separator()
@@ -870,13 +967,13 @@ class PlasmaFractalGUI:
                 self.stop_recording()
                 return
             
-            if (Path(self.recording_directory) / self.recording_file_name).exists():
+            if (self.recording_directory / self.recording_file_name).exists():
                 imgui.open_popup(dialog_title)
             else:
                 self.start_recording()
 
-        if self.confirm_dialog(f'A recording with this name already exists:\n"{self.recording_file_name}"\n\nDo you want to overwrite it?',
-                               dialog_title):
+        if self.confirm_dialog('A recording with this name already exists:\n"{}"\n\nDo you want to overwrite it?',
+                               dialog_title, self.recording_file_name):
             logging.info(f"Confirmed to overwrite existing recording file: {self.recording_file_name}")
             self.start_recording()                  
 
@@ -891,8 +988,25 @@ class PlasmaFractalGUI:
 
         self.is_recording = False
         self.recording_last_saved_file_path = self.recording_directory / self.recording_file_name
+
+        # Give the next recording a fresh time stamp, but keep a file name entered by the user
+        if self.recording_file_name == self._generated_recording_file_name:
+            self.recording_file_name = None
         self.notifications.push_notification(self.Notification.RECORDING_STATE_CHANGED, {'is_recording': self.is_recording})
 
+    def handle_recording_state(self):
+        """
+        Handles recording errors and the automatic stop of the recording. Called on every frame, independent of the 
+        visibility of the recording tab.
+        """
+        # Check for recording errors
+        if (message := self.notifications.pull_notification(self.Notification.RECORDING_ERROR)) is not None:
+            self.is_recording = False
+            self.recording_error_message = message
+
+        # Automatic stop check
+        self.handle_automatic_stop()
+
     def handle_automatic_stop(self):
 
         if self.is_recording and self.recording_time is not None and self.recording_duration > 0:
@@ -74,19 +74,6 @@ class PlasmaFractalParams(SerializableConfig):
         return self._color_function_registry.get_function_info(self.color_function)
 
 
-    def get_current_feedback_params(self) -> List[Any]:
-        """Get ordered parameter values for GLSL function call."""
-        return list(self.feedback_params[self.feedback_function].values())
-    
-    def get_current_warp_params(self) -> List[Any]:
-        """Get ordered parameter values for GLSL function call."""
-        return list(self.warp_params[self.warp_function].values())
-    
-    def get_current_color_params(self) -> List[Any]:
-        """Get ordered parameter values for GLSL function call."""
-        return list(self.color_params[self.color_function].values())
-
-
     def apply_defaults(self) -> None:
         """ Reset all attributes to their default values. """
         self.__init__(self._shader_function_registries)
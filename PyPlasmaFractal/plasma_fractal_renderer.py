@@ -25,6 +25,22 @@ class PlasmaFractalRenderer:
         params (Dict[str, Any]): Configuration dictionary for rendering options.
         shader_cache (VariantShaderCache): Caches and manages shader variants.
     """
+
+    # Scalar attributes that are assigned to shader uniforms on every update
+    PARAM_ATTRIBUTES = ('brightness', 'contrast_steepness', 'contrast_midpoint')
+    NOISE_ATTRIBUTES = (
+        'octaves',
+        'gain',
+        'time_scale_factor',
+        'position_scale_factor',
+        'rotation_angle_increment',
+        'time_offset_increment',
+    )
+    # Precomputed (attribute name, uniform name) pairs
+    PARAM_UNIFORMS      = tuple((attr, f'u_{attr}') for attr in PARAM_ATTRIBUTES)
+    NOISE_UNIFORMS      = tuple((attr, f'u_{attr}') for attr in NOISE_ATTRIBUTES)
+    WARP_NOISE_UNIFORMS = tuple((attr, f'u_warp_{attr}') for attr in NOISE_ATTRIBUTES)
+
     def __init__(self, ctx: moderngl.Context, shader_function_registries: Dict[ShaderFunctionType, FunctionRegistry] ):
         """
         Initializes a new instance of the PlasmaFractalRenderer class.
@@ -58,6 +74,9 @@ class PlasmaFractalRenderer:
         self.warp_function_registry  = shader_function_registries[ShaderFunctionType.WARP]        
         self.color_function_registry = shader_function_registries[ShaderFunctionType.COLOR]
 
+        # Maps each FunctionInfo to its (parameter name, uniform name) pairs, built on first use
+        self._function_uniforms_cache: Dict[FunctionInfo, Tuple[Tuple[str, str], ...]] = {}
+
 
     def _create_fullscreen_quad(self) -> moderngl.Buffer:
         """
@@ -127,57 +146,46 @@ class PlasmaFractalRenderer:
 
         self.program['u_time'].value = noise_time
 
-        attributes = [
-            'brightness', 
-            'contrast_steepness', 
-            'contrast_midpoint',
-        ]
-
-        noise_attributes = [
-            'octaves',
-            'gain',
-            'time_scale_factor',
-            'position_scale_factor',
-            'rotation_angle_increment',
-            'time_offset_increment',
-        ]
-
-        for attr in attributes:
-            self.program[f'u_{attr}'] = getattr(params, attr)
+        for attr, uniform_name in self.PARAM_UNIFORMS:
+            self.program[uniform_name] = getattr(params, attr)
 
         # Set noise attributes
-        for attr in noise_attributes:
-            self.program[f'u_{attr}'] = getattr(params.noise, attr)
+        for attr, uniform_name in self.NOISE_UNIFORMS:
+            self.program[uniform_name] = getattr(params.noise, attr)
 
         # Handling scale separately as it needs to be calculated based on aspect ratio
         self.program['u_scale'] = (params.noise.scale * view_scale.x, params.noise.scale * view_scale.y)
 
         if params.enable_feedback:
             # Set warp noise attributes
-            for attr in noise_attributes:
-                self.program[f'u_warp_{attr}'] = getattr(params.warp_noise, attr)
+            for attr, uniform_name in self.WARP_NOISE_UNIFORMS:
+                self.program[uniform_name] = getattr(params.warp_noise, attr)
 
             self.program['u_warp_scale'] = (params.warp_noise.scale * view_scale.x, params.warp_noise.scale * view_scale.y)
 
             self.program['u_warp_time'] = warp_time  # Use the time directly from warp timer
 
             # Assign the function parameters to their respective shader uniforms
-            self.set_function_uniforms(params.get_current_warp_function_info(), params.get_current_warp_params())
-            self.set_function_uniforms(params.get_current_feedback_blend_function_info(), params.get_current_feedback_params())
+            self.set_function_uniforms(params.get_current_warp_function_info(), params.warp_params[params.warp_function])
+            self.set_function_uniforms(params.get_current_feedback_blend_function_info(), params.feedback_params[params.feedback_function])
 
             feedback_texture.use(location=0)
 
         # Assign the color function parameters to their respective shader uniforms
-        self.set_function_uniforms(params.get_current_color_function_info(), params.get_current_color_params())
+        self.set_function_uniforms(params.get_current_color_function_info(), params.color_params[params.color_function])
 
         
-    def set_function_uniforms(self, function_info: FunctionInfo, values: List[Any]) -> None:
-        """Sets shader uniforms for function parameters."""
+    def set_function_uniforms(self, function_info: FunctionInfo, function_params: Dict[str, Any]) -> None:
+        """Sets shader uniforms for function parameters, directly from the parameter values stored by name."""
         
-        uniform_names = GlslGenerator.get_function_params_uniform_names(function_info)
+        param_uniforms = self._function_uniforms_cache.get(function_info)
+        if param_uniforms is None:
+            uniform_names = GlslGenerator.get_function_params_uniform_names(function_info)
+            param_uniforms = tuple(zip((p.name for p in function_info.params), uniform_names))
+            self._function_uniforms_cache[function_info] = param_uniforms
         
-        for uniform_name, value in zip(uniform_names, values):
-            self.program[uniform_name] = value
+        for param_name, uniform_name in param_uniforms:
+            self.program[uniform_name] = function_params[param_name]
 
 
     @property
@@ -1,14 +1,19 @@
 from pathlib import Path
 import sys
 
-def resource_path(relative_path: str) -> Path:
-    """ Get absolute path to resource, works for dev and for PyInstaller.
-    Assumes that this script is located within a sub directory relative to the main script. """
+def _get_base_path() -> Path:
+    """ Get the directory that contains the resources, works for dev and for PyInstaller. """
     try:
         # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = Path(sys._MEIPASS) / 'PyPlasmaFractal'
+        return Path(sys._MEIPASS) / 'PyPlasmaFractal'
     except AttributeError:
         # In development, the base path is the directory of the current script
-        base_path = Path(__file__).resolve().parent
-        
-    return base_path / relative_path
+        return Path(__file__).resolve().parent
+
+# The base path doesn't change while the application is running, so it is resolved only once
+_BASE_PATH = _get_base_path()
+
+def resource_path(relative_path: str) -> Path:
+    """ Get absolute path to resource, works for dev and for PyInstaller.
+    Assumes that this script is located within a sub directory relative to the main script. """
+    return _BASE_PATH / relative_path
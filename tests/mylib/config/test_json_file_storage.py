@@ -98,6 +98,35 @@ def test_list_json_files(temp_storage):
     assert sorted(listed_files) == sorted(filenames)
 
 
+def test_list_json_files_cached(temp_storage):
+    
+    temp_storage.save({"key": "value"}, "file1.json")
+    assert temp_storage.list() == ["file1.json"]
+
+    # Directory is unchanged, so it must not be scanned again
+    with patch.object(Path, 'glob', side_effect=AssertionError("Directory scanned again")):
+        assert temp_storage.list() == ["file1.json"]
+
+    temp_storage.save({"key": "value"}, "file2.json")
+    assert sorted(temp_storage.list()) == ["file1.json", "file2.json"]
+
+    temp_storage.delete("file1.json")
+    assert temp_storage.list() == ["file2.json"]
+
+
+def test_list_json_files_invalidate_cache(temp_storage, tmp_path):
+    
+    assert temp_storage.list() == []
+
+    # Simulate a file added externally, without a detectable change of the directory modification time
+    with patch.object(Path, 'stat', return_value=temp_storage.directory.stat()):
+        (tmp_path / "external.json").write_text("{}")
+        assert temp_storage.list() == []
+
+        temp_storage.invalidate_cache()
+        assert temp_storage.list() == ["external.json"]
+
+
 @patch.object(Path, 'glob', side_effect=OSError("Cannot list files"))
 def test_list_json_files_failure(mock_glob, temp_storage):
     with pytest.raises(StorageItemListingError):
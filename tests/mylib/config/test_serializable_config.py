@@ -72,6 +72,21 @@ def test_merge_dict_nested(nested_config):
     assert nested_config.child.value == 100
 
 
+def test_merge_dict_nested_keeps_instance(nested_config):
+    """Test that nested configurations are updated in place, including type mismatch handling"""
+    child = nested_config.child
+    nested_config.merge_dict({
+        "child": {
+            "value": "7",  # Should be converted to int
+            "invalid": "ignored"
+        }
+    })
+    assert nested_config.child is child
+    assert nested_config.child.value == 7
+    assert nested_config.child.name == "test"
+    assert not hasattr(nested_config.child, "invalid")
+
+
 def test_merge_type_mismatch(simple_config):
     """Test graceful handling of type mismatches during merge"""
     simple_config.merge_dict({
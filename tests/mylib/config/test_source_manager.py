@@ -84,3 +84,11 @@ def test_list_items_only_user_storage():
 
     assert len(items) == 1
     assert items[0] == StorageSourceManager.Item(name='user_item1', storage=mock_user_storage)
+
+
+def test_invalidate_cache(storage_source_manager, mock_app_storage, mock_user_storage):
+    
+    storage_source_manager.invalidate_cache()
+
+    mock_app_storage.invalidate_cache.assert_called_once()
+    mock_user_storage.invalidate_cache.assert_called_once()
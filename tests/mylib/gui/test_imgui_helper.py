@@ -49,6 +49,19 @@ def test_collapsing_header(test_obj, mocker):
 
     # Assert the result matches the expected value
     assert result is expected_value, f"The result should be {expected_value}"
+
+
+def test_collapsing_header_missing_key(mocker):
+
+    header_mock = mocker.patch('PyPlasmaFractal.mylib.gui.imgui_helper.imgui.collapsing_header', return_value=(True, None))
+    states = {}
+
+    # A missing key defaults to an open header, without being stored
+    result = ih.collapsing_header('Collapsing Header', states, index=('group', 0))
+
+    assert result is True, "The header should be open by default"
+    assert states == {}, "An unchanged default state should not be stored"
+    header_mock.assert_called_once_with('Collapsing Header', flags=ih.imgui.TREE_NODE_DEFAULT_OPEN)
     
 #------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -82,6 +95,20 @@ def test_slider_int_with_list(test_obj, mocker):
 
 #------------------------------------------------------------------------------------------------------------------------------------------
 
+def test_slider_int_multiple(test_obj, mocker):
+
+    # Mock the imgui.slider_int function, returning a value that is not a multiple
+    mock_slider = mocker.patch('PyPlasmaFractal.mylib.gui.imgui_helper.imgui.slider_int', return_value=(True, 47))
+    
+    test_obj.value = 23
+    ih.slider_int('Int Slider', test_obj, 'value', min_value=0, max_value=100, multiple=10)
+    
+    # Both the displayed and the stored value are rounded down to the multiple
+    assert mock_slider.call_args[0][1] == 20
+    assert test_obj.value == 40
+
+#------------------------------------------------------------------------------------------------------------------------------------------
+
 def test_slider_float(test_obj, mocker):
 
     expected_value = 50.5  
@@ -148,6 +175,16 @@ def test_slider_float_direct_index(test_obj, mocker):
 
 #------------------------------------------------------------------------------------------------------------------------------------------
 
+def test_slider_float_non_subscriptable(test_obj, mocker):
+
+    mocker.patch('PyPlasmaFractal.mylib.gui.imgui_helper.imgui.slider_float', return_value=(True, 50.5))
+
+    # Indexing into a scalar attribute must be rejected
+    with pytest.raises(TypeError):
+        ih.slider_float("Float Slider", test_obj, 'value', index=0, min_value=0.0, max_value=100.0)
+
+#------------------------------------------------------------------------------------------------------------------------------------------
+
 def test_checkbox(test_obj, mocker):
 
     expected_value = True
@@ -216,6 +253,37 @@ def test_enum_combo_with_list(test_obj, mocker):
 
 #------------------------------------------------------------------------------------------------------------------------------------------
 
+def test_list_combo(test_obj, mocker):
+
+    items = (24, 30, 60)
+    test_obj.value = 30
+
+    combo_mock = mocker.patch('PyPlasmaFractal.mylib.gui.imgui_helper.imgui.combo', return_value=(True, 2))
+
+    ih.list_combo('Frame Rate', test_obj, 'value', items=items)
+
+    # Assert the value was updated to the selected item
+    assert test_obj.value == 60, "The value should be updated to 60"
+
+    # Assert the display items are passed as strings
+    combo_mock.assert_called_once_with('Frame Rate', 1, ['24', '30', '60'])
+
+
+def test_list_combo_unhashable_items(test_obj, mocker):
+
+    items = ([1, 2], [3, 4])
+    test_obj.value = [1, 2]
+
+    combo_mock = mocker.patch('PyPlasmaFractal.mylib.gui.imgui_helper.imgui.combo', return_value=(True, 1))
+
+    ih.list_combo('Pair', test_obj, 'value', items=items)
+
+    # Assert a tuple of unhashable items is displayed as strings
+    assert test_obj.value == [3, 4], "The value should be updated to the selected item"
+    combo_mock.assert_called_once_with('Pair', 0, ['[1, 2]', '[3, 4]'])
+
+#------------------------------------------------------------------------------------------------------------------------------------------
+
 def test_input_text(test_obj, mocker):
 
     new_text = "updated text"
@@ -243,3 +311,23 @@ def test_input_int(test_obj, mocker):
     
     # Assert the integer attribute was updated correctly
     assert test_obj.int_attr == new_value, f"The int_attr should be updated to {new_value}"
+
+#------------------------------------------------------------------------------------------------------------------------------------------
+
+def test_clipped_range(mocker):
+
+    # 100 items of 10 pixels height, scrolled by 25 items in a window of 50 pixels height
+    mocker.patch('PyPlasmaFractal.mylib.gui.imgui_helper.imgui.get_text_line_height_with_spacing', return_value=10.0)
+    mocker.patch('PyPlasmaFractal.mylib.gui.imgui_helper.imgui.get_scroll_y', return_value=250.0)
+    mocker.patch('PyPlasmaFractal.mylib.gui.imgui_helper.imgui.get_window_height', return_value=50.0)
+    style = mocker.patch('PyPlasmaFractal.mylib.gui.imgui_helper.imgui.get_style').return_value
+    style.item_spacing.y = 2.0
+    dummy = mocker.patch('PyPlasmaFractal.mylib.gui.imgui_helper.imgui.dummy')
+
+    indices = list(ih.clipped_range(100))
+
+    # Assert only the visible items (plus one for partial visibility) are yielded
+    assert indices == list(range(25, 32)), "Only the visible items should be yielded"
+
+    # Assert the space of the invisible items is reserved, minus the item spacing added by the dummy items
+    assert dummy.call_args_list == [mocker.call(0, 248.0), mocker.call(0, 678.0)]
@@ -0,0 +1,111 @@
+import gc
+import threading
+from unittest.mock import MagicMock, patch
+import numpy as np
+import pytest
+
+from PyPlasmaFractal.mylib.recording.video_recorder import VideoRecorder, VideoRecorderException
+
+
+class FakeTexture:
+    def __init__(self, width, height, value=0.5):
+        self.dtype = 'f4'
+        self.data = np.full((height, width, 4), value, dtype=np.float32).tobytes()
+
+    def use(self):
+        pass
+
+    def read(self):
+        return self.data
+
+
+@pytest.fixture
+def mock_writer():
+    writer = MagicMock()
+    with patch('imageio.get_writer', return_value=writer):
+        yield writer
+
+
+def test_capture_frames_written_by_worker_thread(mock_writer, tmp_path):
+    """Test that frames are encoded on the writer thread and flushed when recording stops"""
+    writer_threads = set()
+    mock_writer.append_data.side_effect = lambda frame: writer_threads.add(threading.current_thread())
+
+    # Room for two 4x2 RGB frames
+    recorder = VideoRecorder(max_queued_bytes=2 * 4 * 2 * 3)
+    recorder.start_recording(str(tmp_path / 'test.mp4'), 4, 2, fps=30)
+    for _ in range(5):
+        recorder.capture_frame(FakeTexture(4, 2))
+    recorder.stop_recording()
+
+    assert not recorder.is_recording
+    assert recorder.frame_count == 5
+    assert mock_writer.append_data.call_count == 5
+    assert threading.current_thread() not in writer_threads
+    mock_writer.close.assert_called_once()
+
+    frame = mock_writer.append_data.call_args[0][0]
+    assert frame.shape == (2, 4, 3)
+    assert frame.dtype == np.uint8
+    assert (frame == 127).all()
+
+
+@pytest.mark.parametrize("width, height, expected_frames", [
+    (1920, 1080, 21),   # 6 MiB per frame
+    (3840, 2160, 5),    # 24 MiB per frame
+    (7680, 4320, 1),    # 95 MiB per frame, at least one frame is queued
+])
+def test_queue_bounded_by_bytes(mock_writer, tmp_path, width, height, expected_frames):
+    """Test that the number of queued frames is derived from the frame size"""
+    recorder = VideoRecorder(max_queued_bytes=128 * 1024 * 1024)
+    recorder.start_recording(str(tmp_path / 'test.mp4'), width, height)
+
+    assert recorder._frame_queue.maxsize == expected_frames
+
+    recorder.stop_recording()
+
+
+def test_writer_error_reported_on_capture(mock_writer, tmp_path):
+    """Test that an error on the writer thread aborts the recording on the next capture"""
+    mock_writer.append_data.side_effect = OSError("Disk full")
+
+    recorder = VideoRecorder()
+    recorder.start_recording(str(tmp_path / 'test.mp4'), 4, 2)
+    recorder.capture_frame(FakeTexture(4, 2))
+
+    # Wait until the writer thread has processed the frame
+    recorder._stop_writer_thread()
+
+    with pytest.raises(VideoRecorderException):
+        recorder.capture_frame(FakeTexture(4, 2))
+
+    assert not recorder.is_recording
+    mock_writer.close.assert_called_once()
+
+
+def test_writer_error_reported_on_stop(mock_writer, tmp_path):
+    """Test that an error on the writer thread is reported when recording stops"""
+    mock_writer.append_data.side_effect = OSError("Disk full")
+
+    recorder = VideoRecorder()
+    recorder.start_recording(str(tmp_path / 'test.mp4'), 4, 2)
+    recorder.capture_frame(FakeTexture(4, 2))
+
+    with pytest.raises(VideoRecorderException):
+        recorder.stop_recording()
+
+    assert not recorder.is_recording
+    mock_writer.close.assert_called_once()
+
+
+def test_dropping_active_recorder_closes_writer(mock_writer, tmp_path):
+    """Test that an active recording is finalized when the recorder is garbage collected"""
+    recorder = VideoRecorder()
+    recorder.start_recording(str(tmp_path / 'test.mp4'), 4, 2)
+    recorder.capture_frame(FakeTexture(4, 2))
+
+    del recorder
+    gc.collect()
+
+    mock_writer.append_data.assert_called_once()
+    mock_writer.close.assert_called_once()